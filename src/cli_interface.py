@@ -4,6 +4,7 @@ Interface de linha de comando para o Firewall Simulator
 
 import argparse
 from src.firewall_core import FirewallSimulator
+from src.pcap_reader import replay_pcap, DEFAULT_BATCH_SIZE
 
 def main():
     banner = """
@@ -20,6 +21,7 @@ def main():
 Exemplos de uso:
   python cli_interface.py --rules regras.txt --src-ip 192.168.1.100 --dst-port 80
   python cli_interface.py --rules regras.txt --interactive
+  python cli_interface.py --rules regras.txt --pcap captura.pcap
         '''
     )
     
@@ -48,6 +50,16 @@ Exemplos de uso:
         action='store_true',
         help='Modo interativo para testar múltiplos pacotes'
     )
+    parser.add_argument(
+        '--pcap',
+        help='Arquivo libpcap cujos pacotes serao avaliados (ex: captura.pcap)'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'Pacotes avaliados por lote no modo --pcap (padrão: {DEFAULT_BATCH_SIZE})'
+    )
     parser.add_argument(
         '--list-rules', '-l',
         action='store_true',
@@ -64,7 +76,17 @@ Exemplos de uso:
         if args.list_rules:
             firewall.list_rules()
         
-        if args.interactive:
+        if args.pcap:
+            summary = replay_pcap(firewall, args.pcap, args.batch_size)
+            print(f"\n[RESUMO PCAP] {args.pcap}")
+            print(f"   Registros lidos: {summary['records']}")
+            print(f"   Pacotes avaliados: {summary['evaluated']}")
+            print(f"   Ignorados (nao IPv4 TCP/UDP): {summary['skipped']}")
+            print(f"   ALLOW: {summary['ALLOW']}")
+            print(f"   BLOCK: {summary['BLOCK']}")
+            print(f"   Tempo: {summary['elapsed']:.3f}s ({summary['packets_per_second']:.0f} pacotes/s)")
+        
+        elif args.interactive:
             print("\n[Modo interativo ativo] Digite 'quit' para sair.")
             while True:
                 try:
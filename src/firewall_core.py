@@ -68,6 +68,17 @@ class FirewallSimulator:
         
         return self.default_policy
     
+    def evaluate_batch(self, packets):
+        """
+        Avalia um lote de pacotes contra todas as regras
+        Args:
+            packets (list): Tuplas (src_ip, dst_port, protocol)
+        Returns:
+            list: Decisões "ALLOW" ou "BLOCK", na mesma ordem dos pacotes
+        """
+        return [self.evaluate_packet(src_ip, dst_port, protocol)
+                for src_ip, dst_port, protocol in packets]
+    
     def _parse_rule(self, rule_string):
         """
         Interpreta string de regra e converte para objeto
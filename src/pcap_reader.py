@@ -0,0 +1,198 @@
+"""
+Leitura de arquivos libpcap para replay de tráfego no Firewall Simulator
+"""
+
+import mmap
+import os
+import struct
+import time
+
+PCAP_GLOBAL_HEADER_LEN = 24
+PCAP_RECORD_HEADER_LEN = 16
+
+# Magic numbers (microssegundos e nanossegundos) como lidos em little-endian
+PCAP_MAGIC_LE = {0xa1b2c3d4, 0xa1b23c4d}
+PCAP_MAGIC_BE = {0xd4c3b2a1, 0x4d3cb2a1}
+
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW = 101
+LINKTYPE_LINUX_SLL = 113
+
+ETHERTYPE_IPV4 = 0x0800
+ETHERTYPE_VLAN = {0x8100, 0x88a8}
+
+IP_PROTOCOLS = {6: 'TCP', 17: 'UDP'}
+
+DEFAULT_BATCH_SIZE = 4096
+
+
+def iter_pcap_packets(filename, stats=None):
+    """
+    Percorre um arquivo pcap extraindo (src_ip, dst_port, protocolo) de cada pacote
+    O arquivo é mapeado em memória e os cabeçalhos são lidos diretamente do
+    mapeamento, sem copiar payloads, então o uso de memória independe do tamanho
+    Args:
+        filename (str): Caminho do arquivo pcap
+        stats (dict): Opcional; recebe contadores 'records' e 'skipped'
+    Returns:
+        generator: Tuplas (src_ip, dst_port, protocol) de pacotes IPv4 TCP/UDP
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('records', 0)
+    stats.setdefault('skipped', 0)
+
+    try:
+        f = open(filename, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo pcap não encontrado: {filename}")
+
+    with f:
+        if os.fstat(f.fileno()).st_size < PCAP_GLOBAL_HEADER_LEN:
+            raise ValueError(f"Arquivo pcap inválido: '{filename}'. Cabeçalho global incompleto")
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            magic = struct.unpack_from('<I', view, 0)[0]
+            if magic in PCAP_MAGIC_LE:
+                endian = '<'
+            elif magic in PCAP_MAGIC_BE:
+                endian = '>'
+            else:
+                raise ValueError(f"Arquivo pcap inválido: '{filename}'. Magic number desconhecido: {magic:#010x}")
+
+            linktype = struct.unpack_from(endian + 'I', view, 20)[0] & 0x0FFFFFFF
+            if linktype not in (LINKTYPE_ETHERNET, LINKTYPE_RAW, LINKTYPE_LINUX_SLL):
+                raise ValueError(f"Tipo de enlace não suportado: {linktype}. Use Ethernet, RAW ou Linux SLL")
+
+            record_fmt = endian + '8xI4x'
+            size = len(view)
+            offset = PCAP_GLOBAL_HEADER_LEN
+
+            while offset + PCAP_RECORD_HEADER_LEN <= size:
+                incl_len = struct.unpack_from(record_fmt, view, offset)[0]
+                start = offset + PCAP_RECORD_HEADER_LEN
+                end = start + incl_len
+                if end > size:
+                    # Captura truncada (ex.: tcpdump interrompido): ignora o registro parcial
+                    break
+                offset = end
+                stats['records'] += 1
+
+                packet = _parse_frame(view, start, end, linktype)
+                if packet is None:
+                    stats['skipped'] += 1
+                else:
+                    yield packet
+        finally:
+            view.release()
+            mm.close()
+
+
+def _parse_frame(view, start, end, linktype):
+    """
+    Extrai campos de um quadro capturado
+    Args:
+        view (memoryview): Visão do arquivo mapeado
+        start (int): Offset do início do quadro
+        end (int): Offset do fim dos bytes capturados
+        linktype (int): Tipo de enlace do arquivo pcap
+    Returns:
+        tuple: (src_ip, dst_port, protocol) ou None se não for IPv4 TCP/UDP
+    """
+    if linktype == LINKTYPE_ETHERNET:
+        pos = start + 12
+        if pos + 2 > end:
+            return None
+        ethertype = struct.unpack_from('!H', view, pos)[0]
+        pos += 2
+        while ethertype in ETHERTYPE_VLAN:
+            if pos + 4 > end:
+                return None
+            ethertype = struct.unpack_from('!2xH', view, pos)[0]
+            pos += 4
+        if ethertype != ETHERTYPE_IPV4:
+            return None
+    elif linktype == LINKTYPE_LINUX_SLL:
+        if start + 16 > end:
+            return None
+        if struct.unpack_from('!14xH', view, start)[0] != ETHERTYPE_IPV4:
+            return None
+        pos = start + 16
+    else:
+        pos = start
+
+    return _parse_ipv4(view, pos, end)
+
+
+def _parse_ipv4(view, pos, end):
+    """
+    Lê IP de origem, protocolo e porta de destino de um cabeçalho IPv4
+    Args:
+        view (memoryview): Visão do arquivo mapeado
+        pos (int): Offset do início do cabeçalho IPv4
+        end (int): Offset do fim dos bytes capturados
+    Returns:
+        tuple: (src_ip, dst_port, protocol) ou None se não for IPv4 TCP/UDP
+    """
+    if pos + 20 > end:
+        return None
+    ver_ihl, frag, proto, a, b, c, d = struct.unpack_from('!B5xH1xB2x4B', view, pos)
+    if ver_ihl >> 4 != 4:
+        return None
+    protocol = IP_PROTOCOLS.get(proto)
+    if protocol is None:
+        return None
+    # Fragmentos não iniciais não carregam o cabeçalho TCP/UDP
+    if frag & 0x1FFF:
+        return None
+    port_pos = pos + (ver_ihl & 0x0F) * 4 + 2
+    if port_pos + 2 > end:
+        return None
+    dst_port = struct.unpack_from('!H', view, port_pos)[0]
+    return (f"{a}.{b}.{c}.{d}", dst_port, protocol)
+
+
+def replay_pcap(firewall, filename, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Avalia todos os pacotes de um arquivo pcap no firewall, em lotes
+    Args:
+        firewall (FirewallSimulator): Firewall com as regras carregadas
+        filename (str): Caminho do arquivo pcap
+        batch_size (int): Quantidade de pacotes avaliados por lote
+    Returns:
+        dict: Resumo com 'records', 'evaluated', 'skipped', 'ALLOW', 'BLOCK',
+              'elapsed' (segundos) e 'packets_per_second'
+    """
+    if batch_size <= 0:
+        raise ValueError(f"Tamanho de lote inválido: {batch_size}. Deve ser maior que 0")
+
+    summary = {'records': 0, 'skipped': 0, 'evaluated': 0, 'ALLOW': 0, 'BLOCK': 0}
+    batch = []
+    started = time.perf_counter()
+
+    for packet in iter_pcap_packets(filename, summary):
+        batch.append(packet)
+        if len(batch) >= batch_size:
+            _count_decisions(summary, firewall.evaluate_batch(batch))
+            batch = []
+    if batch:
+        _count_decisions(summary, firewall.evaluate_batch(batch))
+
+    elapsed = time.perf_counter() - started
+    summary['elapsed'] = elapsed
+    summary['packets_per_second'] = summary['records'] / elapsed if elapsed > 0 else 0.0
+    return summary
+
+
+def _count_decisions(summary, decisions):
+    """
+    Acumula decisões de um lote no resumo
+    Args:
+        summary (dict): Resumo sendo acumulado
+        decisions (list): Decisões "ALLOW"/"BLOCK" do lote
+    """
+    summary['evaluated'] += len(decisions)
+    for decision in decisions:
+        summary[decision] = summary.get(decision, 0) + 1
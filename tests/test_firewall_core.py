@@ -171,6 +171,15 @@ class TestFirewallSimulator(unittest.TestCase):
         result = self.firewall.evaluate_packet("192.168.1.100", 80, "UDP")
         self.assertEqual(result, "ALLOW")
     
+    def test_evaluate_batch(self):
+        """Testa avaliação de lote de pacotes na ordem recebida"""
+        self.firewall.add_rule("BLOCK PORT 80")
+        result = self.firewall.evaluate_batch([
+            ("192.168.1.100", 80, "TCP"),
+            ("192.168.1.100", 443, "UDP"),
+        ])
+        self.assertEqual(result, ["BLOCK", "ALLOW"])
+    
     def test_load_rules_from_file(self):
         """Testa carregar regras de arquivo"""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
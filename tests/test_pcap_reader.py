@@ -0,0 +1,158 @@
+"""
+Testes unitários para o módulo pcap_reader
+"""
+
+import unittest
+import os
+import struct
+import tempfile
+from src.firewall_core import FirewallSimulator
+from src.pcap_reader import iter_pcap_packets, replay_pcap
+
+
+def build_ipv4(src_ip, proto, dst_port, frag=0):
+    """Monta cabeçalho IPv4 (sem opções) seguido de portas TCP/UDP"""
+    src = bytes(int(octet) for octet in src_ip.split('.'))
+    header = struct.pack('!BBHHHBBH4s4s', 0x45, 0, 40, 0, frag, 64, proto, 0,
+                         src, bytes([10, 0, 0, 1]))
+    return header + struct.pack('!HH', 12345, dst_port) + b'\x00' * 16
+
+
+def build_ethernet(payload, ethertype=0x0800):
+    """Monta quadro Ethernet com o payload informado"""
+    return b'\x00' * 12 + struct.pack('!H', ethertype) + payload
+
+
+def write_pcap(frames, linktype=1, endian='<', truncate=0):
+    """Grava arquivo pcap temporário com os quadros informados"""
+    chunks = [struct.pack(endian + 'IHHiIII', 0xa1b2c3d4, 2, 4, 0, 0, 65535, linktype)]
+    for frame in frames:
+        chunks.append(struct.pack(endian + 'IIII', 0, 0, len(frame), len(frame)) + frame)
+    data = b''.join(chunks)
+    if truncate:
+        data = data[:-truncate]
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pcap') as f:
+        f.write(data)
+        return f.name
+
+
+class TestPcapReader(unittest.TestCase):
+    """Testes para leitura e replay de arquivos pcap"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.files = []
+
+    def tearDown(self):
+        """Remove arquivos temporários criados pelo teste"""
+        for filename in self.files:
+            os.unlink(filename)
+
+    def make_pcap(self, frames, **kwargs):
+        """Cria pcap temporário removido ao final do teste"""
+        filename = write_pcap(frames, **kwargs)
+        self.files.append(filename)
+        return filename
+
+    def test_iter_ethernet_tcp_udp(self):
+        """Testa extração de IP, porta e protocolo de quadros Ethernet"""
+        filename = self.make_pcap([
+            build_ethernet(build_ipv4("192.168.1.100", 6, 80)),
+            build_ethernet(build_ipv4("10.0.0.50", 17, 53)),
+        ])
+        packets = list(iter_pcap_packets(filename))
+        self.assertEqual(packets, [("192.168.1.100", 80, "TCP"),
+                                   ("10.0.0.50", 53, "UDP")])
+
+    def test_iter_big_endian(self):
+        """Testa leitura de arquivo gravado em big-endian"""
+        filename = self.make_pcap([build_ethernet(build_ipv4("1.2.3.4", 6, 443))], endian='>')
+        self.assertEqual(list(iter_pcap_packets(filename)), [("1.2.3.4", 443, "TCP")])
+
+    def test_iter_raw_ip(self):
+        """Testa leitura de arquivo com enlace RAW (sem cabeçalho Ethernet)"""
+        filename = self.make_pcap([build_ipv4("172.16.0.1", 6, 22)], linktype=101)
+        self.assertEqual(list(iter_pcap_packets(filename)), [("172.16.0.1", 22, "TCP")])
+
+    def test_iter_vlan(self):
+        """Testa quadro Ethernet com tag 802.1Q"""
+        payload = struct.pack('!HH', 100, 0x0800) + build_ipv4("192.168.0.9", 17, 161)
+        filename = self.make_pcap([build_ethernet(payload, ethertype=0x8100)])
+        self.assertEqual(list(iter_pcap_packets(filename)), [("192.168.0.9", 161, "UDP")])
+
+    def test_iter_skips_unsupported_packets(self):
+        """Testa que pacotes não IPv4 TCP/UDP são contados como ignorados"""
+        filename = self.make_pcap([
+            build_ethernet(b'\x00' * 28, ethertype=0x0806),
+            build_ethernet(build_ipv4("192.168.1.1", 1, 0)),
+            build_ethernet(build_ipv4("192.168.1.1", 6, 80, frag=10)),
+            build_ethernet(build_ipv4("192.168.1.1", 6, 80)[:22]),
+            build_ethernet(build_ipv4("192.168.1.2", 6, 8080)),
+        ])
+        stats = {}
+        packets = list(iter_pcap_packets(filename, stats))
+        self.assertEqual(packets, [("192.168.1.2", 8080, "TCP")])
+        self.assertEqual(stats, {'records': 5, 'skipped': 4})
+
+    def test_iter_truncated_record(self):
+        """Testa que registro final incompleto é descartado"""
+        filename = self.make_pcap([
+            build_ethernet(build_ipv4("192.168.1.1", 6, 80)),
+            build_ethernet(build_ipv4("192.168.1.2", 6, 443)),
+        ], truncate=5)
+        self.assertEqual(list(iter_pcap_packets(filename)), [("192.168.1.1", 80, "TCP")])
+
+    def test_iter_invalid_file(self):
+        """Testa erro ao ler arquivo que não é pcap"""
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pcap') as f:
+            f.write(b'nao e um pcap' * 4)
+            self.files.append(f.name)
+        with self.assertRaises(ValueError):
+            list(iter_pcap_packets(f.name))
+
+        empty = self.make_pcap([])
+        with open(empty, 'wb'):
+            pass
+        with self.assertRaises(ValueError):
+            list(iter_pcap_packets(empty))
+
+    def test_iter_unsupported_linktype(self):
+        """Testa erro com tipo de enlace não suportado"""
+        filename = self.make_pcap([], linktype=105)
+        with self.assertRaises(ValueError):
+            list(iter_pcap_packets(filename))
+
+    def test_iter_file_not_found(self):
+        """Testa erro ao ler arquivo inexistente"""
+        with self.assertRaises(FileNotFoundError):
+            list(iter_pcap_packets("captura_inexistente.pcap"))
+
+    def test_replay_pcap_summary(self):
+        """Testa resumo de decisões do replay em lotes"""
+        firewall = FirewallSimulator()
+        firewall.add_rule("BLOCK IP 192.168.1.100")
+        firewall.add_rule("BLOCK PORT 23")
+        filename = self.make_pcap([
+            build_ethernet(build_ipv4("192.168.1.100", 6, 80)),
+            build_ethernet(build_ipv4("192.168.1.200", 6, 23)),
+            build_ethernet(build_ipv4("192.168.1.200", 17, 53)),
+            build_ethernet(b'\x00' * 28, ethertype=0x86dd),
+            build_ethernet(build_ipv4("10.0.0.1", 6, 443)),
+        ])
+        summary = replay_pcap(firewall, filename, batch_size=2)
+        self.assertEqual(summary['records'], 5)
+        self.assertEqual(summary['evaluated'], 4)
+        self.assertEqual(summary['skipped'], 1)
+        self.assertEqual(summary['ALLOW'], 2)
+        self.assertEqual(summary['BLOCK'], 2)
+        self.assertGreaterEqual(summary['packets_per_second'], 0)
+
+    def test_replay_pcap_invalid_batch_size(self):
+        """Testa erro com tamanho de lote inválido"""
+        filename = self.make_pcap([])
+        with self.assertRaises(ValueError):
+            replay_pcap(FirewallSimulator(), filename, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()